@@ -1,15 +1,27 @@
 #!/usr/bin/env python
 import idaapi
 import enum
+import functools
+import sys
+import weakref
+
+# idaapi attributes used on hot paths, bound once at import so call
+# sites skip the module-dict probe per use
+_parse_decl = idaapi.parse_decl
+_tinfo_t = idaapi.tinfo_t
+_IDATI = idaapi.cvar.idati
+_PT_TYP = idaapi.PT_TYP
+_func_type_data_t = idaapi.func_type_data_t
+_funcarg_t = idaapi.funcarg_t
 
 
 def get_pointer_size():
-    tif = idaapi.tinfo_t()
-    idaapi.parse_decl(tif, idaapi.cvar.idati, 'void *;', idaapi.PT_TYP)
+    tif = _tinfo_t()
+    _parse_decl(tif, _IDATI, 'void *;', _PT_TYP)
     return tif.get_size()
 
 
-POITNER_SIZE = get_pointer_size()
+POINTER_SIZE = get_pointer_size()
 
 TYPE_ALIASES = {
     'int': 'int32_t',
@@ -18,6 +30,86 @@ TYPE_ALIASES = {
 }
 
 
+def _normalize_decl(decl):
+    '''
+    Collapse decl normalization (coercion, aliasing, terminator) into one
+    helper shared by every construction path
+
+    Args:
+        decl: Name of type or valid C type declaration
+
+    Returns:
+        str: Normalized declaration ending with `;`
+    '''
+    if isinstance(decl, _tinfo_t):
+        decl = decl.dstr()
+    elif not isinstance(decl, str):
+        decl = str(decl)
+
+    decl = TYPE_ALIASES.get(decl, decl)
+
+    if len(decl) == 0:
+        raise ValueError('Empty decl')
+
+    if decl[-1] != ';':
+        decl = decl + ';'
+    return decl
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_decl_cached(decl):
+    '''
+    Parse a normalized declaration once and cache the resulting tinfo_t
+
+    Callers must copy the returned tinfo_t before mutating it, otherwise
+    the cached entry gets poisoned
+
+    Args:
+        decl (str): Normalized (aliased, `;`-terminated) declaration
+
+    Returns:
+        _tinfo_t: Parsed type, or None for a bad declaration
+    '''
+    tif = _tinfo_t()
+    success = _parse_decl(tif, _IDATI, decl, _PT_TYP)
+    if success is None:
+        return None
+    return tif
+
+
+# Scratch objects reused by get_tinfo; create_ptr/create_array copy the
+# data into the tinfo_t, so reusing them between calls is safe under
+# IDA's single-threaded scripting model
+_PTR_TYPE_DATA = idaapi.ptr_type_data_t()
+_ARRAY_TYPE_DATA = idaapi.array_type_data_t()
+
+# Sizes of leaf (non-pointer/array/function) types keyed by canonical
+# decl; shared across instances since a decl always sizes the same
+_SIZE_CACHE = {}
+
+# Shared instances handed out by Type.interned, keyed by normalized decl;
+# weak values so unused entries die with their last holder
+_TYPE_INTERN = weakref.WeakValueDictionary()
+
+# Primitives that dominate real scripts; pre-parsing them at import makes
+# their first construction a cache hit already
+_PRIMITIVE_DECLS = ('void', 'bool', 'char', 'int8_t', 'uint8_t', 'int16_t',
+                    'uint16_t', 'int32_t', 'uint32_t', 'int64_t', 'uint64_t',
+                    'float', 'double', 'void *', 'char *', 'int32_t *')
+for _primitive in _PRIMITIVE_DECLS:
+    _parse_decl_cached(f'{_primitive};')
+del _primitive
+
+
+# Bit flags packed into Type._flags; one int slot instead of six bools
+_F_CONST = 1
+_F_VOLATILE = 2
+_F_PTR = 4
+_F_ARRAY = 8
+_F_FUNCTION = 16
+_F_STRUCT = 32
+
+
 class CallingConventions(enum.Enum):
     invalid = 0
     unknown = 16
@@ -38,6 +130,12 @@ class CallingConventions(enum.Enum):
     # mask = 240
 
 
+# Value -> member table; going through CallingConventions(value) raises
+# ValueError whenever IDA spoils the low bits, making exceptions the
+# common path during function type extraction
+_CC_BY_VALUE = {cc.value: cc for cc in CallingConventions}
+
+
 class Type:
     '''
     Wrapper class to represent types in IDA
@@ -60,129 +158,325 @@ class Type:
         print(anonymous_struct_ptr_t.points_to().is_anonymous()) # True
     '''
 
+    __slots__ = ('_decl', '_flags', '_contained_type', '_contained_tif',
+                 '_element_count', '_ret_type', '_ret_tif', '_arg_types',
+                 '_arg_tifs', '_cc', '_struct_name', '_fields', '_tif',
+                 '_size', '_decl_raw', '_parsed', '_dirty', '__weakref__')
+
     def __init__(self, decl=None):
         '''
         Args:
             decl: Name of type or valid C type declaration (with ;)
         '''
         self._decl = '?'
-
-        self._is_const = False
-        self._is_volatile = False
+        self._flags = 0
 
         self._contained_type = None
-        self._is_ptr = False
-        self._is_array = False
+        self._contained_tif = None
         self._element_count = 0
 
-        self._is_function = False
         self._ret_type = None
-        self._arg_types = list()
+        self._ret_tif = None
+        # The shared empty tuple; most Types never have args or fields,
+        # so no per-instance list gets allocated for them
+        self._arg_types = ()
+        self._arg_tifs = None
         self._cc = CallingConventions.invalid
 
-        self._is_struct = False
         self._struct_name = ''
-        self._fields = list()
+        self._fields = ()
+
+        self._tif = None
+        self._size = None
+
+        self._decl_raw = None
+        self._parsed = decl is None
+        self._dirty = False
 
         if decl is not None:
-            if isinstance(decl, idaapi.tinfo_t):
-                decl = decl.dstr()
+            if isinstance(decl, _tinfo_t):
+                # Already parsed; use a copy directly instead of the old
+                # dstr() -> parse_decl round-trip
+                self._tif = _tinfo_t(decl)
+            else:
+                self._decl_raw = _normalize_decl(decl)
 
-            if decl in TYPE_ALIASES:
-                decl = TYPE_ALIASES[decl]
+    @classmethod
+    def _from_tif(cls, tif):
+        '''
+        Build a Type from an already-parsed tinfo_t, skipping the
+        dstr() -> parse_decl round-trip entirely
 
-            if not isinstance(decl, str):
-                decl = str(decl)
+        Args:
+            tif (_tinfo_t): Parsed type to copy from
 
-            if len(decl) == 0:
-                raise ValueError('Empty decl')
+        Returns:
+            Type: Wrapper around a copy of the given tinfo_t
+        '''
+        new = cls()
+        new._tif = _tinfo_t(tif)
+        new._parsed = False  # Flags get extracted lazily from the copy
+        return new
 
-            decl = decl if decl.endswith(';') else f'{decl};'
-            tif = idaapi.tinfo_t()
-            success = idaapi.parse_decl(tif, idaapi.cvar.idati, decl, idaapi.PT_TYP)
-            if success is None:
+    def _ensure_parsed(self):
+        '''
+        Parse the declaration and populate the introspection flags on first
+        access; Types only used as building blocks never pay for the parse
+        '''
+        if self._parsed:
+            return
+
+        tif = self._tif
+        if tif is None:
+            decl = self._decl_raw
+            cached = _parse_decl_cached(decl)
+            if cached is None:
                 raise ValueError(f'Bad declaration "{decl}"')
+            # Copy so per-instance mutation cannot poison the cache
+            tif = _tinfo_t(cached)
+
+        # Read each SWIG-wrapped value exactly once into locals; every
+        # tif.* access crosses the Python/C boundary
+        is_ptr = tif.is_ptr()
+        is_array = tif.is_array()
+        is_function = tif.is_funcptr()
+
+        # Interned, since a handful of distinct decls cover most instances
+        self._decl = sys.intern(tif.dstr())
+
+        flags = 0
+        if tif.is_const():
+            flags |= _F_CONST
+        if tif.is_volatile():
+            flags |= _F_VOLATILE
+        if is_ptr and not is_function:
+            # Function pointers are not reported as plain pointers,
+            # for compatability's sake
+            flags |= _F_PTR
+        if is_array:
+            flags |= _F_ARRAY
+        if is_function:
+            flags |= _F_FUNCTION
+        self._flags = flags
+
+        # Child Types are materialized on demand; only their tinfo_t
+        # handles are kept here
+        if is_ptr and not is_function:
+            self._contained_tif = tif.get_pointed_object()
+        elif is_array:
+            self._element_count = tif.get_array_nelems()
+            self._contained_tif = tif.get_array_element()
+
+        if is_function:
+            self._ret_tif = tif.get_rettype()
+            func_type_data = _func_type_data_t()
+            func_tif = tif.get_pointed_object()
+            func_tif.get_func_details(func_type_data)
+            cc_value = func_type_data.cc
+            cc = _CC_BY_VALUE.get(cc_value)
+            if cc is None:
+                # Spoiled low bits; retry with them flipped like the old
+                # except-path did
+                cc = _CC_BY_VALUE.get(cc_value ^ 3)
+            if cc is None:
+                raise ValueError(f'{cc_value} is not a valid CallingConventions')
+            self._cc = cc
+            # func_type_data already holds the arg list, so iterating it
+            # beats a get_nth_arg SWIG call per argument; copy each
+            # tinfo_t out since the container is about to die
+            self._arg_tifs = [_tinfo_t(func_type_data[idx].type)
+                              for idx in range(func_type_data.size())]
+
+        if tif.is_struct():
+            self._flags |= _F_STRUCT
+            struct_name = tif.get_type_name()
+            self._struct_name = sys.intern(struct_name) if struct_name else ''
+            # TODO: extract fields
+            raise NotImplementedError()
+
+        self._tif = tif
+        # Only mark done on success; a failed parse (or the struct branch
+        # above) must re-raise on every access instead of leaving a
+        # half-initialized object that looks valid
+        self._parsed = True
+
+    def _ensure_contained(self):
+        '''
+        Materialize the contained Type from its stored tinfo_t on first use
 
-            self._decl = tif.dstr()
-
-            self._is_const = tif.is_const()
-            self._is_volatile = tif.is_volatile()
-
-            self._is_ptr = tif.is_ptr()
-            self._is_array = tif.is_array()
-            self._is_function = tif.is_funcptr()
-
-            if self._is_ptr and not self._is_function:
-                self._contained_type = Type(tif.get_pointed_object().dstr())
-            elif self._is_array:
-                self._element_count = tif.get_array_nelems()
-                self._contained_type = Type(tif.get_array_element().dstr())
-
-            if self._is_function:
-                self._is_ptr = False  # For compatability's sake
-                self._ret_type = Type(tif.get_rettype().dstr())
-                func_type_data = idaapi.func_type_data_t()
-                func_tif = tif.get_pointed_object()
-                func_tif.get_func_details(func_type_data)
-                try:
-                    self._cc = CallingConventions(func_type_data.cc)
-                except ValueError:
-                    self._cc = CallingConventions(func_type_data.cc ^ 3)
-                for idx in range(tif.get_nargs()):
-                    self._arg_types.append(Type(tif.get_nth_arg(idx).dstr()))
-
-            if tif.is_struct():
-                self._is_struct = True
-                self._struct_name = tif.get_type_name()
-                # TODO: extract fields
-                raise NotImplementedError()
+        Returns:
+            Type: The contained type, or None for non-boxed types
+        '''
+        if self._contained_type is None and self._contained_tif is not None:
+            self._contained_type = tinfo_to_type(self._contained_tif)
+            self._contained_tif = None
+        return self._contained_type
+
+    def _ensure_ret_type(self):
+        '''
+        Materialize the return Type from its stored tinfo_t on first use
+
+        Returns:
+            Type: The return type, or None for non-function types
+        '''
+        if self._ret_type is None and self._ret_tif is not None:
+            self._ret_type = tinfo_to_type(self._ret_tif)
+            self._ret_tif = None
+        return self._ret_type
+
+    def _ensure_args(self):
+        '''
+        Materialize the argument Types from their stored tinfo_t's on
+        first use
+
+        Returns:
+            [Type]: The argument types
+        '''
+        if self._arg_tifs is not None:
+            self._arg_types = tuple(tinfo_to_type(arg_tif)
+                                    for arg_tif in self._arg_tifs)
+            self._arg_tifs = None
+        return self._arg_types
 
     def clone(self):
         '''
         Returns: Type: A new object identical to this one
         '''
-        return Type(self.get_tinfo().dstr())
+        return self._shallow_copy()
+
+    @classmethod
+    def from_decls(cls, decls):
+        '''
+        Bulk-construct Types from declarations, sharing the parse cache
+        and hoisting the per-call normalization out of the loop
+
+        Example:
+            arg_types = Type.from_decls(['int', 'char *', 'void *'])
+
+        Args:
+            decls (iterable): Names or valid C type declarations
+
+        Returns:
+            [Type]: A Type per declaration, in order
+        '''
+        normalize = _normalize_decl
+        cache = _parse_decl_cached
+        from_tif = cls._from_tif
+        out = []
+        append = out.append
+        for decl in decls:
+            tif = cache(normalize(decl))
+            if tif is None:
+                raise ValueError(f'Bad declaration "{decl}"')
+            append(from_tif(tif))
+        return out
+
+    @classmethod
+    def interned(cls, decl):
+        '''
+        Flyweight factory returning one shared instance per declaration
+
+        Interned instances must be treated as immutable - mutating one
+        mutates it for every holder. Use Type(decl) or clone() when
+        mutation is intended.
+
+        Example:
+            int32_t = Type.interned('int')
+            assert Type.interned('int') is int32_t
+
+        Args:
+            decl: Name of type or valid C type declaration (with ;)
+
+        Returns:
+            Type: The shared instance for this declaration
+        '''
+        decl = _normalize_decl(decl)
+
+        shared = _TYPE_INTERN.get(decl)
+        if shared is None:
+            shared = cls(decl)
+            _TYPE_INTERN[decl] = shared
+        return shared
+
+    def _shallow_copy(self):
+        '''
+        Field-level copy that never touches the IDA parser; sub-Types are
+        shared by reference, which is safe as long as neither side mutates
+        them in place
+
+        Returns:
+            Type: A new object with the same fields as this one
+        '''
+        copied = Type()
+        copied._decl = self._decl
+        copied._flags = self._flags
+        copied._contained_type = self._contained_type
+        copied._contained_tif = self._contained_tif
+        copied._element_count = self._element_count
+        copied._ret_type = self._ret_type
+        copied._ret_tif = self._ret_tif
+        copied._arg_types = tuple(self._arg_types)
+        copied._arg_tifs = list(self._arg_tifs) if self._arg_tifs is not None else None
+        copied._cc = self._cc
+        copied._struct_name = self._struct_name
+        copied._fields = tuple(self._fields)
+        copied._tif = _tinfo_t(self._tif) if self._tif is not None else None
+        copied._size = self._size
+        copied._decl_raw = self._decl_raw
+        copied._parsed = self._parsed
+        copied._dirty = self._dirty
+        return copied
 
     def get_tinfo(self):
         '''
         Returns:
             idaapi.tinto_f: tinfo_t object representing this Type object
         '''
-        if self.is_pointer():
-            ptr_type_data = idaapi.ptr_type_data_t()
-            ptr_type_data.obj_type = self._contained_type.get_tinfo()
-            tif = idaapi.tinfo_t()
-            tif.create_ptr(ptr_type_data)
-        elif self.is_array():
-            array_type_data = idaapi.array_type_data_t()
-            array_type_data.elem_type = self._contained_type.get_tinfo()
-            array_type_data.base = 0
-            array_type_data.nelems = self._element_count
-            tif = idaapi.tinfo_t()
-            tif.create_array(array_type_data)
-        elif self.is_function():
-            func_type_data = idaapi.func_type_data_t()
-            func_type_data.rettype = self._ret_type.get_tinfo()
+        # Mutators drop _tif / raise _dirty, so a clean cached tinfo_t can
+        # be returned straight away without recomposing
+        if self._tif is not None and not self._dirty:
+            return _tinfo_t(self._tif)
+
+        self._ensure_parsed()
+        flags = self._flags
+        if flags & _F_PTR:
+            _PTR_TYPE_DATA.obj_type = self._ensure_contained().get_tinfo()
+            tif = _tinfo_t()
+            tif.create_ptr(_PTR_TYPE_DATA)
+        elif flags & _F_ARRAY:
+            _ARRAY_TYPE_DATA.elem_type = self._ensure_contained().get_tinfo()
+            _ARRAY_TYPE_DATA.base = 0
+            _ARRAY_TYPE_DATA.nelems = self._element_count
+            tif = _tinfo_t()
+            tif.create_array(_ARRAY_TYPE_DATA)
+        elif flags & _F_FUNCTION:
+            func_type_data = _func_type_data_t()
+            func_type_data.rettype = self._ensure_ret_type().get_tinfo()
             func_type_data.cc = self._cc.value
-            for arg in self._arg_types:
-                funcarg = idaapi.funcarg_t()
+            for arg in self._ensure_args():
+                funcarg = _funcarg_t()
                 funcarg.type = arg.get_tinfo()
                 func_type_data.push_back(funcarg)
-            func_tif = idaapi.tinfo_t()
+            func_tif = _tinfo_t()
             func_tif.create_func(func_type_data)
-            tif = idaapi.tinfo_t()
-            ptr_type_data = idaapi.ptr_type_data_t()
-            ptr_type_data.obj_type = func_tif
-            tif.create_ptr(ptr_type_data)
-        elif self.is_struct():
+            tif = _tinfo_t()
+            _PTR_TYPE_DATA.obj_type = func_tif
+            tif.create_ptr(_PTR_TYPE_DATA)
+        elif flags & _F_STRUCT:
             raise NotImplementedError()
         else:
-            tif = idaapi.tinfo_t()
-            idaapi.parse_decl(tif, idaapi.cvar.idati, f'{self._decl};', idaapi.PT_TYP)
-            return tif
+            if self._tif is not None:
+                # Copy so callers mutating the returned tinfo_t cannot
+                # corrupt the cached one
+                return _tinfo_t(self._tif)
+            cached = _parse_decl_cached(f'{self._decl};')
+            return _tinfo_t(cached) if cached is not None else _tinfo_t()
 
         # TODO: add const/volatile information
-        return tif
+        self._tif = tif
+        self._decl = sys.intern(tif.dstr())
+        self._dirty = False
+        return _tinfo_t(tif)
 
     def register(self):
         '''
@@ -200,32 +494,46 @@ class Type:
         Returns:
             bool: True if value is annotated as const, False otherwise
         '''
-        return self._is_const
+        self._ensure_parsed()
+        return bool(self._flags & _F_CONST)
 
     def is_volatile(self):
         '''
         Returns:
             bool: True if type is annotated as volatile, False otherwise
         '''
-        return self._is_volatile
+        self._ensure_parsed()
+        return bool(self._flags & _F_VOLATILE)
 
     def set_const(self):
-        self._is_const = True
+        self._ensure_parsed()
+        self._flags |= _F_CONST
+        self._dirty = True
 
     def set_volatile(self):
-        self._is_volatile = True
+        self._ensure_parsed()
+        self._flags |= _F_VOLATILE
+        self._dirty = True
 
     def clear_const(self):
-        self._is_const = False
+        self._ensure_parsed()
+        self._flags &= ~_F_CONST
+        self._dirty = True
 
     def clear_volatile(self):
-        self._is_volatile = False
+        self._ensure_parsed()
+        self._flags &= ~_F_VOLATILE
+        self._dirty = True
 
     def toggle_const(self):
-        self.is_const = not self._is_const
+        self._ensure_parsed()
+        self._flags ^= _F_CONST
+        self._dirty = True
 
     def toggle_volatile(self):
-        self._is_volatile = not self._is_volatile
+        self._ensure_parsed()
+        self._flags ^= _F_VOLATILE
+        self._dirty = True
 
     def is_pointer(self):
         '''
@@ -235,7 +543,8 @@ class Type:
         `T` -> False
         `T *` -> True
         '''
-        return self._is_ptr
+        self._ensure_parsed()
+        return bool(self._flags & _F_PTR)
 
     def is_array(self):
         '''
@@ -246,25 +555,45 @@ class Type:
             `T` -> False
             `T[]` -> True
         '''
-        return self._is_array
+        self._ensure_parsed()
+        return bool(self._flags & _F_ARRAY)
 
     def is_function(self):
         '''
         Returns:
             bool: True if represents a function type, False otherwise
         '''
-        return self._is_function
+        self._ensure_parsed()
+        return bool(self._flags & _F_FUNCTION)
 
     def get_size(self):
         '''
         Returns:
             int: Size in bytes
         '''
-        if self.is_array():
-            return self._element_count * self._contained_type.get_size()
-        elif self.is_pointer or self.is_function():
-            return POINTER_SIZE
-        return self.get_tinfo().get_size()
+        if self._size is not None:
+            return self._size
+
+        self._ensure_parsed()
+        flags = self._flags
+        if flags & _F_ARRAY:
+            # Walk nested dimensions iteratively so an N-dimensional
+            # array costs one leaf size query, not one per dimension
+            mult = self._element_count
+            cur = self._ensure_contained()
+            while cur.is_array():
+                mult *= cur._element_count
+                cur = cur._ensure_contained()
+            self._size = mult * cur.get_size()
+        elif flags & (_F_PTR | _F_FUNCTION):
+            self._size = POINTER_SIZE
+        else:
+            size = _SIZE_CACHE.get(self._decl)
+            if size is None:
+                size = self.get_tinfo().get_size()
+                _SIZE_CACHE[self._decl] = size
+            self._size = size
+        return self._size
 
     def get_pointer_to(self):
         '''
@@ -273,12 +602,16 @@ class Type:
         Returns:
             Type: A type pointing to the type represented by this instance
         '''
-        if self.get_tinfo().dstr() == '':
+        # Empty means no parsed tinfo and no shape either - composing a
+        # tinfo_t just to stringify and test it would cost a compose per
+        # wrapped layer
+        self._ensure_parsed()
+        if self._tif is None and self._flags == 0:
             raise ValueError('Cannot create pointer to empty type')
 
         pointer_type = Type()
-        pointer_type._is_ptr = True
-        pointer_type._contained_type = self.clone()
+        pointer_type._flags = _F_PTR
+        pointer_type._contained_type = self._shallow_copy()
 
         return pointer_type
 
@@ -296,9 +629,9 @@ class Type:
             raise ValueError('Must have a natural number for element count')
 
         array_type = Type()
-        array_type._is_array = True
+        array_type._flags = _F_ARRAY
         array_type._element_count = element_count
-        array_type._contained_type = self.clone()
+        array_type._contained_type = self._shallow_copy()
 
         return array_type
 
@@ -309,25 +642,32 @@ class Type:
         Returns:
             Type: The type pointer to by this instance
         '''
-        if not self.is_array() and not self.is_pointer():
+        self._ensure_parsed()
+        if not self._flags & (_F_ARRAY | _F_PTR):
             raise ValueError('Not a boxed type')
-        return self._contained_type.clone()
+        return self._ensure_contained()._shallow_copy()
 
     def set_contained_type(self, contained_type):
         '''
         Args:
             contained_type (Type): New contained type
         '''
-        if not self.is_array() and not self.is_pointer():
+        self._ensure_parsed()
+        if not self._flags & (_F_ARRAY | _F_PTR):
             raise ValueError('Not a boxed type')
         self._contained_type = contained_type
+        self._contained_tif = None
+        self._tif = None
+        self._size = None
+        self._dirty = True
 
     def get_element_count(self):
         '''
         Returns:
             int: Element count of array type
         '''
-        if not self.is_array():
+        self._ensure_parsed()
+        if not self._flags & _F_ARRAY:
             raise ValueError('Not an array type')
         return self._element_count
 
@@ -336,34 +676,41 @@ class Type:
         Args:
             element_count (int): New element count
         '''
-        if not self.is_array():
+        self._ensure_parsed()
+        if not self._flags & _F_ARRAY:
             raise ValueError('Not an array type')
         self._element_count = element_count
+        self._tif = None
+        self._size = None
+        self._dirty = True
 
     def get_args(self):
         '''
         Returns:
             [Type]: Argument type of function type
         '''
-        if not self.is_function():
+        self._ensure_parsed()
+        if not self._flags & _F_FUNCTION:
             raise ValueError('Not a function type')
-        return self._arg_types
+        return self._ensure_args()
 
     def get_ret_type(self):
         '''
         Returns:
             Type: Return type of function type
         '''
-        if not self.is_function():
+        self._ensure_parsed()
+        if not self._flags & _F_FUNCTION:
             raise ValueError('Not a function type')
-        return self._ret_type
+        return self._ensure_ret_type()
 
     def get_calling_convention(self):
         '''
         Returns:
             CallingConventions: CC of function type
         '''
-        if not self.is_function():
+        self._ensure_parsed()
+        if not self._flags & _F_FUNCTION:
             raise ValueError('Not a function type')
         return self._cc
 
@@ -372,42 +719,55 @@ class Type:
         Args:
             args ([Type]): New argument types
         '''
-        if not self.is_function():
+        self._ensure_parsed()
+        if not self._flags & _F_FUNCTION:
             raise ValueError('Not a function type')
-        self._arg_types = args
+        self._arg_types = tuple(args)
+        self._arg_tifs = None
+        self._tif = None
+        self._dirty = True
 
     def set_ret_type(self, ret_type):
         '''
         Args:
             ret_type (Type): New return type
         '''
-        if not self.is_function():
+        self._ensure_parsed()
+        if not self._flags & _F_FUNCTION:
             raise ValueError('Not a function type')
         self._ret_type = ret_type
+        self._ret_tif = None
+        self._tif = None
+        self._dirty = True
 
     def set_calling_convention(self, cc):
         '''
         Args:
             cc (CallingConventions|int): New calling convention
         '''
-        if not self.is_function():
+        self._ensure_parsed()
+        if not self._flags & _F_FUNCTION:
             raise ValueError('Not a function type')
         if not isinstance(cc, CallingConventions):
             cc = CallingConventions(cc)
         self._cc = cc
+        self._tif = None
+        self._dirty = True
 
     def is_struct(self):
         '''
         Returns:
             bool: True if is a struct type, False otherwise
         '''
-        return self._is_struct
+        self._ensure_parsed()
+        return bool(self._flags & _F_STRUCT)
 
     def get_struct_name(self):
         '''
         Returns:
             str: Name of a struct type
         '''
+        self._ensure_parsed()
         return self._struct_name
 
     def get_fields(self):
@@ -415,7 +775,8 @@ class Type:
         Returns:
             [Field]: Fields of a struct type
         '''
-        if not self.is_struct():
+        self._ensure_parsed()
+        if not self._flags & _F_STRUCT:
             raise ValueError('Not a struct type')
         return self._fields
 
@@ -425,21 +786,67 @@ class Type:
             struct_name (str): New struct name
         '''
         self._struct_name = struct_name
+        self._dirty = True
 
     def set_fields(self, fields):
         '''
         Args:
             struct_name ([Field]): New struct fields
         '''
-        if not self.is_struct():
+        self._ensure_parsed()
+        if not self._flags & _F_STRUCT:
             raise ValueError('Not a struct type')
-        self._fields = fields
+        self._fields = tuple(fields)
+        self._dirty = True
 
     def __str__(self):
+        self._ensure_parsed()
+        if not self._dirty and self._decl != '?':
+            return self._decl
         return self.get_tinfo().dstr()
 
+    def __repr__(self):
+        return f'Type({str(self)!r})'
+
     def __eq__(self, other):
-        return self.get_tinfo() == other.get_tinfo()
+        if not isinstance(other, Type):
+            return NotImplemented
+        return str(self) == str(other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+
+def tinfo_to_type(tif):
+    '''
+    Convert a parsed tinfo_t into a Type, unwrapping pointer/array layers
+    iteratively so no layer round-trips through the C parser
+
+    Args:
+        tif (_tinfo_t): Parsed type
+
+    Returns:
+        Type: Equivalent Type object
+    '''
+    layers = []
+    cur = tif
+    while not cur.is_funcptr():
+        if cur.is_ptr():
+            layers.append(None)
+            cur = cur.get_pointed_object()
+        elif cur.is_array():
+            layers.append(cur.get_array_nelems())
+            cur = cur.get_array_element()
+        else:
+            break
+
+    result = Type._from_tif(cur)
+    for element_count in reversed(layers):
+        if element_count is None:
+            result = result.get_pointer_to()
+        else:
+            result = result.get_array_of(element_count)
+    return result
 
 
 class Field:
@@ -450,5 +857,8 @@ class Field:
     - get offset within struct
     - get xrefs to field
     '''
+
+    __slots__ = ('_name', '_size', '_type')
+
     def __init__(self, name, size, type):
         raise NotImplementedError()